@@ -0,0 +1,40 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+    import json
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialise an object to a JSON string.
+
+    Args:
+        obj: JSON-serialisable value.
+        indent: If True, pretty-print with two-space indentation.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialise an object to compact UTF-8 encoded JSON.
+
+    orjson produces bytes natively, so this skips the str round trip that
+    dumps() needs.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -1,12 +1,22 @@
 """TokTab API client."""
 
+import asyncio
+import atexit
+import threading
 from typing import Any
 
 import httpx
 
+from toktab import _json, cache
+
 BASE_URL = "https://toktab.com/api"
 TIMEOUT = 10.0
 
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+_async_client: httpx.AsyncClient | None = None
+_inflight: dict[str, "asyncio.Task[dict[str, Any]]"] = {}
+
 
 class TokTabError(Exception):
     """Base exception for TokTab API errors."""
@@ -26,11 +36,94 @@ class APIError(TokTabError):
     pass
 
 
-def get_model(slug: str) -> dict[str, Any]:
+def _revalidate(stale: tuple[Any, str] | None) -> dict[str, str] | None:
+    # Ask the server to answer 304 if the expired cache entry is still current
+    return {"If-None-Match": stale[1]} if stale else None
+
+
+def _client_options() -> dict[str, Any]:
+    """Options shared by the sync and async clients.
+
+    HTTP/2 lets concurrent requests share a single connection instead of
+    opening one socket (and TLS handshake) per request.
+    """
+    return {
+        "base_url": BASE_URL,
+        "timeout": TIMEOUT,
+        "follow_redirects": True,
+        "http2": True,
+        "limits": httpx.Limits(
+            max_keepalive_connections=10,
+            max_connections=20,
+            keepalive_expiry=30.0,
+        ),
+    }
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections alive between requests, so only
+    the first call pays for the TCP and TLS handshakes.
+    """
+    global _client
+    if _client is None:
+        # Batch lookups call this from worker threads
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**_client_options())
+    return _client
+
+
+def _close_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(**_client_options())
+    return _async_client
+
+
+async def close_async() -> None:
+    """Close the shared async HTTP client if it was created.
+
+    The async client is bound to the event loop it was first used in, so
+    callers should await this before that loop finishes.
+    """
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.aclose()
+
+
+def _close_async_client() -> None:
+    """Best-effort close of the async client at interpreter exit."""
+    if _async_client is None:
+        return
+    try:
+        asyncio.run(close_async())
+    except RuntimeError:
+        # The client's event loop is gone; nothing left to clean up.
+        pass
+
+
+atexit.register(_close_client)
+atexit.register(_close_async_client)
+
+
+def get_model(slug: str, use_cache: bool = True) -> dict[str, Any]:
     """Fetch detailed information for a specific model.
 
     Args:
         slug: The model identifier (e.g., 'gemini-3-flash-preview')
+        use_cache: If False, bypass the on-disk response cache.
 
     Returns:
         Dict containing model data including pricing and capabilities.
@@ -39,27 +132,39 @@ def get_model(slug: str) -> dict[str, Any]:
         ModelNotFoundError: If the model doesn't exist.
         APIError: If the API request fails.
     """
-    url = f"{BASE_URL}/{slug}/"
+    key = cache.make_key(f"model:{slug}")
+    stale = None
+    if use_cache:
+        if (cached := cache.get(key)) is not None:
+            return cached
+        stale = cache.get_stale(key)
     try:
-        response = httpx.get(url, timeout=TIMEOUT, follow_redirects=True)
+        response = _get_client().get(f"/{slug}/", headers=_revalidate(stale))
+        if response.status_code == 304 and stale:
+            cache.touch(key, etag=response.headers.get("ETag"))
+            return stale[0]
         if response.status_code == 404:
             raise ModelNotFoundError(f"Model '{slug}' not found")
         response.raise_for_status()
-        return response.json()
+        data = _json.loads(response.content)
     except httpx.TimeoutException:
         raise APIError("Request timed out. Please try again.")
     except httpx.HTTPStatusError as e:
         raise APIError(f"API error: {e.response.status_code}")
     except httpx.RequestError as e:
         raise APIError(f"Network error: {e}")
+    if use_cache:
+        cache.set(key, data, etag=response.headers.get("ETag"))
+    return data
 
 
-def search(query: str, limit: int = 20) -> dict[str, Any]:
+def search(query: str, limit: int = 20, use_cache: bool = True) -> dict[str, Any]:
     """Search for models by name or provider.
 
     Args:
         query: Search term (supports partial matches and 'provider:' prefix)
         limit: Maximum number of results (default 20, max 50)
+        use_cache: If False, bypass the on-disk response cache.
 
     Returns:
         Dict containing 'results', 'query', and 'count'.
@@ -67,12 +172,23 @@ def search(query: str, limit: int = 20) -> dict[str, Any]:
     Raises:
         APIError: If the API request fails.
     """
-    url = f"{BASE_URL}/search"
     params = {"q": query, "limit": min(limit, 50)}
+    # provider: filters are applied server-side, so key on the exact query sent
+    key = cache.make_key(f"search:{params['q']}:{params['limit']}")
+    stale = None
+    if use_cache:
+        if (cached := cache.get(key)) is not None:
+            return cached
+        stale = cache.get_stale(key)
     try:
-        response = httpx.get(url, params=params, timeout=TIMEOUT, follow_redirects=True)
+        response = _get_client().get(
+            "/search", params=params, headers=_revalidate(stale)
+        )
+        if response.status_code == 304 and stale:
+            cache.touch(key, etag=response.headers.get("ETag"))
+            return stale[0]
         response.raise_for_status()
-        return response.json()
+        data = _json.loads(response.content)
     except httpx.TimeoutException:
         raise APIError("Request timed out. Please try again.")
     except httpx.HTTPStatusError as e:
@@ -81,5 +197,104 @@ def search(query: str, limit: int = 20) -> dict[str, Any]:
         raise APIError(f"API error: {e.response.status_code}")
     except httpx.RequestError as e:
         raise APIError(f"Network error: {e}")
+    if use_cache:
+        cache.set(key, data, etag=response.headers.get("ETag"))
+    return data
+
+
+async def aget_model(slug: str, use_cache: bool = True) -> dict[str, Any]:
+    """Fetch detailed information for a specific model asynchronously.
+
+    Concurrent calls for the same slug share a single request, and all
+    callers receive the same dict.
 
+    Args:
+        slug: The model identifier (e.g., 'gemini-3-flash-preview')
+        use_cache: If False, bypass the on-disk response cache.
+
+    Returns:
+        Dict containing model data including pricing and capabilities.
 
+    Raises:
+        ModelNotFoundError: If the model doesn't exist.
+        APIError: If the API request fails.
+    """
+    key = cache.make_key(f"model:{slug}")
+    if use_cache and (cached := cache.get(key)) is not None:
+        return cached
+    task = _inflight.get(slug)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_model_async(slug, key, use_cache))
+        _inflight[slug] = task
+        task.add_done_callback(lambda _: _inflight.pop(slug, None))
+    # Shield the shared task so cancelling one caller doesn't cancel the rest
+    return await asyncio.shield(task)
+
+
+async def _fetch_model_async(slug: str, key: str, use_cache: bool) -> dict[str, Any]:
+    stale = cache.get_stale(key) if use_cache else None
+    try:
+        response = await _get_async_client().get(
+            f"/{slug}/", headers=_revalidate(stale)
+        )
+        if response.status_code == 304 and stale:
+            cache.touch(key, etag=response.headers.get("ETag"))
+            return stale[0]
+        if response.status_code == 404:
+            raise ModelNotFoundError(f"Model '{slug}' not found")
+        response.raise_for_status()
+        data = _json.loads(response.content)
+    except httpx.TimeoutException:
+        raise APIError("Request timed out. Please try again.")
+    except httpx.HTTPStatusError as e:
+        raise APIError(f"API error: {e.response.status_code}")
+    except httpx.RequestError as e:
+        raise APIError(f"Network error: {e}")
+    if use_cache:
+        cache.set(key, data, etag=response.headers.get("ETag"))
+    return data
+
+
+async def asearch(
+    query: str, limit: int = 20, use_cache: bool = True
+) -> dict[str, Any]:
+    """Search for models by name or provider asynchronously.
+
+    Args:
+        query: Search term (supports partial matches and 'provider:' prefix)
+        limit: Maximum number of results (default 20, max 50)
+        use_cache: If False, bypass the on-disk response cache.
+
+    Returns:
+        Dict containing 'results', 'query', and 'count'.
+
+    Raises:
+        APIError: If the API request fails.
+    """
+    params = {"q": query, "limit": min(limit, 50)}
+    key = cache.make_key(f"search:{params['q']}:{params['limit']}")
+    stale = None
+    if use_cache:
+        if (cached := cache.get(key)) is not None:
+            return cached
+        stale = cache.get_stale(key)
+    try:
+        response = await _get_async_client().get(
+            "/search", params=params, headers=_revalidate(stale)
+        )
+        if response.status_code == 304 and stale:
+            cache.touch(key, etag=response.headers.get("ETag"))
+            return stale[0]
+        response.raise_for_status()
+        data = _json.loads(response.content)
+    except httpx.TimeoutException:
+        raise APIError("Request timed out. Please try again.")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400:
+            raise APIError("Invalid search query")
+        raise APIError(f"API error: {e.response.status_code}")
+    except httpx.RequestError as e:
+        raise APIError(f"Network error: {e}")
+    if use_cache:
+        cache.set(key, data, etag=response.headers.get("ETag"))
+    return data
@@ -0,0 +1,167 @@
+"""On-disk response cache for the TokTab API client.
+
+Entries live in a single SQLite database in WAL mode, so several toktab
+processes (e.g. shell prompt integrations) can read and write concurrently.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_dir
+
+from toktab import _json
+
+CACHE_DIR = Path(user_cache_dir("toktab"))
+DEFAULT_TTL = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    expires INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT
+)
+"""
+
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+_lock = threading.Lock()
+
+
+def make_key(value: str) -> str:
+    """Build a cache key from a request description.
+
+    Args:
+        value: A string identifying the request (e.g., 'model:gpt-4o').
+
+    Returns:
+        Hex SHA-256 digest of the value.
+    """
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared connection, opening it on first use.
+
+    Must be called with _lock held; batch lookups use the cache from
+    several threads.
+    """
+    global _conn, _conn_path
+    path = CACHE_DIR / "cache.sqlite3"
+    if _conn is None or _conn_path != path:
+        if _conn is not None:
+            _conn.close()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        _conn_path = path
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute(_SCHEMA)
+        columns = {row[1] for row in _conn.execute("PRAGMA table_info(entries)")}
+        if "etag" not in columns:
+            _conn.execute("ALTER TABLE entries ADD COLUMN etag TEXT")
+    return _conn
+
+
+def get(key: str) -> Any | None:
+    """Return a cached value if present and not expired.
+
+    Args:
+        key: Cache key from make_key().
+
+    Returns:
+        The cached value, or None on a miss.
+    """
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT body FROM entries WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return _json.loads(row[0])
+    except (OSError, sqlite3.Error, ValueError):
+        return None
+
+
+def get_stale(key: str) -> tuple[Any, str] | None:
+    """Return a cached value and its ETag, even if the entry has expired.
+
+    Used to revalidate expired entries with a conditional request.
+
+    Args:
+        key: Cache key from make_key().
+
+    Returns:
+        Tuple of (value, etag), or None if there is no entry with an ETag.
+    """
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT body, etag FROM entries WHERE key = ? AND etag IS NOT NULL",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return _json.loads(row[0]), row[1]
+    except (OSError, sqlite3.Error, ValueError):
+        return None
+
+
+def set(key: str, value: Any, ttl: int = DEFAULT_TTL, etag: str | None = None) -> None:
+    """Store a value in the cache.
+
+    Failures to write are ignored; the cache is an optimisation only.
+
+    Args:
+        key: Cache key from make_key().
+        value: JSON-serialisable value to store.
+        ttl: Time to live in seconds.
+        etag: ETag the server sent with the value, if any.
+    """
+    try:
+        with _lock:
+            _connect().execute(
+                "INSERT OR REPLACE INTO entries (key, expires, body, etag) "
+                "VALUES (?, ?, ?, ?)",
+                (key, int(time.time() + ttl), _json.dumps_bytes(value), etag),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def touch(key: str, ttl: int = DEFAULT_TTL, etag: str | None = None) -> None:
+    """Extend an entry's lifetime after the server confirms it is unchanged.
+
+    Args:
+        key: Cache key from make_key().
+        ttl: Time to live in seconds, from now.
+        etag: New ETag sent with the 304, if any; otherwise the old one is kept.
+    """
+    try:
+        with _lock:
+            _connect().execute(
+                "UPDATE entries SET expires = ?, etag = COALESCE(?, etag) "
+                "WHERE key = ?",
+                (int(time.time() + ttl), etag, key),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def clear() -> int:
+    """Remove all cached entries.
+
+    Returns:
+        Number of entries removed.
+    """
+    try:
+        with _lock:
+            return _connect().execute("DELETE FROM entries").rowcount
+    except (OSError, sqlite3.Error):
+        return 0
@@ -1,24 +1,22 @@
 """TokTab CLI - LLM pricing data at your fingertips."""
 
+from typing import Any, TextIO
+
 import click
 
 from toktab import __version__
-from toktab.api import (
-    get_model,
-    search as api_search,
-    ModelNotFoundError,
-    APIError,
-)
-from toktab.display import (
-    display_model,
-    display_search_results,
-    display_error,
-)
+
+# The API client (httpx) and display layer (Rich) are imported inside each
+# command so that --help and --version start quickly.
 
 
 class TokTabGroup(click.Group):
     """Custom group that allows both subcommands and direct model lookup."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._dyn_cache: dict[str, click.Command] = {}
+
     def get_command(self, ctx, cmd_name):
         """Override get_command to handle model lookups."""
         # First try to get a real subcommand
@@ -26,12 +24,28 @@ class TokTabGroup(click.Group):
         if rv is not None:
             return rv
 
-        # If no subcommand found, create a dynamic command for model lookup
+        # If no subcommand found, use a dynamic command for model lookup.
+        # Click may resolve the same name more than once (e.g. for help).
+        rv = self._dyn_cache.get(cmd_name)
+        if rv is None:
+            rv = self._dyn_cache[cmd_name] = self._make_model_command(cmd_name)
+        return rv
+
+    @staticmethod
+    def _make_model_command(slug: str) -> click.Command:
+        """Build a command that looks up and displays a single model."""
+
         @click.pass_context
         def model_lookup_command(ctx_inner):
-            json_output = ctx.params.get('json_output', False)
+            from toktab.api import APIError, ModelNotFoundError, get_model
+            from toktab.display import display_error, display_model
+
+            # Group options (--json, --no-cache) live on the parent context
+            group_params = ctx_inner.parent.params if ctx_inner.parent else {}
+            json_output = group_params.get('json_output', False)
+            no_cache = group_params.get('no_cache', False)
             try:
-                data = get_model(cmd_name)
+                data = get_model(slug, use_cache=not no_cache)
                 display_model(data, json_output=json_output)
             except ModelNotFoundError as e:
                 display_error(str(e))
@@ -40,14 +54,15 @@ class TokTabGroup(click.Group):
                 display_error(str(e))
                 ctx_inner.exit(1)
 
-        return click.Command(cmd_name, callback=model_lookup_command)
+        return click.Command(slug, callback=model_lookup_command)
 
 
 @click.command(cls=TokTabGroup, invoke_without_command=True)
 @click.option("--json", "json_output", is_flag=True, help="Output raw JSON")
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
 @click.option("--version", is_flag=True, help="Show version")
 @click.pass_context
-def cli(ctx: click.Context, json_output: bool, version: bool) -> None:
+def cli(ctx: click.Context, json_output: bool, no_cache: bool, version: bool) -> None:
     """TokTab - LLM pricing data at your fingertips.
 
     Get pricing info for a model:
@@ -66,11 +81,23 @@ def cli(ctx: click.Context, json_output: bool, version: bool) -> None:
         click.echo(ctx.get_help())
 
 
+def _use_cache(no_cache: bool) -> bool:
+    """Whether a subcommand should use the cache.
+
+    --no-cache is honoured both on the subcommand and before it
+    (e.g. 'toktab --no-cache compare ...').
+    """
+    parent = click.get_current_context().parent
+    group_no_cache = parent.params.get("no_cache", False) if parent else False
+    return not (no_cache or group_no_cache)
+
+
 @cli.command()
 @click.argument("query")
 @click.option("--limit", "-l", default=20, help="Number of results (max 50)")
 @click.option("--json", "json_output", is_flag=True, help="Output raw JSON")
-def search(query: str, limit: int, json_output: bool) -> None:
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def search(query: str, limit: int, json_output: bool, no_cache: bool) -> None:
     """Search for models by name or provider.
 
     Examples:
@@ -83,13 +110,119 @@ def search(query: str, limit: int, json_output: bool) -> None:
 
         toktab search "provider:openai gpt-4"
     """
+    from toktab.api import APIError, search as api_search
+    from toktab.display import display_error, display_search_results
+
     try:
-        data = api_search(query, limit=limit)
+        data = api_search(query, limit=limit, use_cache=_use_cache(no_cache))
         display_search_results(data, json_output=json_output)
     except APIError as e:
         display_error(str(e))
         raise SystemExit(1)
 
 
+async def _fetch_models(
+    slugs: tuple[str, ...], use_cache: bool = True
+) -> list[dict[str, Any]]:
+    """Fetch several models concurrently over the shared async client."""
+    import asyncio
+
+    from toktab.api import aget_model, close_async
+
+    try:
+        return await asyncio.gather(
+            *(aget_model(slug, use_cache=use_cache) for slug in slugs)
+        )
+    finally:
+        await close_async()
+
+
+@cli.command()
+@click.argument("slugs", nargs=-1, required=True)
+@click.option("--json", "json_output", is_flag=True, help="Output raw JSON")
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def compare(slugs: tuple[str, ...], json_output: bool, no_cache: bool) -> None:
+    """Compare pricing for several models side by side.
+
+    Examples:
+
+        toktab compare gpt-4o claude-3-opus
+
+        toktab compare gpt-4o gpt-4o-mini gemini-1-5-flash
+    """
+    import asyncio
+
+    from toktab.api import APIError, ModelNotFoundError
+    from toktab.display import display_comparison, display_error
+
+    try:
+        models = asyncio.run(_fetch_models(slugs, use_cache=_use_cache(no_cache)))
+        display_comparison(models, json_output=json_output)
+    except (ModelNotFoundError, APIError) as e:
+        display_error(str(e))
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.argument("source", type=click.File("r"), default="-")
+@click.option("--json", "json_output", is_flag=True, help="Output raw JSON")
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def batch(source: TextIO, json_output: bool, no_cache: bool) -> None:
+    """Look up many models, one slug per line, from a file or stdin.
+
+    Lookups run in parallel and results are shown in input order.
+
+    Examples:
+
+        toktab batch slugs.txt
+
+        printf "gpt-4o\nclaude-3-opus\n" | toktab batch -
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from toktab.api import APIError, ModelNotFoundError, get_model
+    from toktab.display import display_comparison, display_error, display_model
+
+    slugs = [line.strip() for line in source if line.strip()]
+    use_cache = _use_cache(no_cache)
+    models = []
+    failed = False
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(get_model, slug, use_cache=use_cache) for slug in slugs
+        ]
+        # Render each result as soon as it's ready while later ones download
+        for future in futures:
+            try:
+                data = future.result()
+            except (ModelNotFoundError, APIError) as e:
+                display_error(str(e))
+                failed = True
+                continue
+            if json_output:
+                models.append(data)
+            else:
+                display_model(data)
+
+    if json_output:
+        display_comparison(models, json_output=True)
+    if failed:
+        raise SystemExit(1)
+
+
+@cli.group(name="cache")
+def cache_group() -> None:
+    """Manage the local response cache."""
+
+
+@cache_group.command(name="clear")
+def cache_clear() -> None:
+    """Remove all cached API responses."""
+    from toktab import cache
+
+    removed = cache.clear()
+    click.echo(f"Removed {removed} cached response(s)")
+
+
 if __name__ == "__main__":
     cli()
@@ -1,16 +1,85 @@
 """Display formatting for TokTab CLI using Rich."""
 
-import json
-from typing import Any
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-
-console = Console()
-
-
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from toktab import _json
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+# Rich is imported lazily so that commands which never render (e.g. --version)
+# don't pay for loading it.
+_console: "Console | None" = None
+_err_console: "Console | None" = None
+
+_CAPABILITY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("supports_vision", "Vision"),
+    ("supports_function_calling", "Functions"),
+    ("supports_tool_choice", "Tool choice"),
+    ("supports_prompt_caching", "Caching"),
+    ("supports_response_schema", "Schema"),
+    ("supports_system_messages", "System msgs"),
+    ("supports_audio_input", "Audio in"),
+    ("supports_audio_output", "Audio out"),
+    ("supports_pdf_input", "PDF"),
+)
+_CAP_KEYS = tuple(field for field, _ in _CAPABILITY_FIELDS)
+_CAP_LABELS = dict(_CAPABILITY_FIELDS)
+_CAP_SET = frozenset(_CAP_KEYS)
+
+# Column specs as (header, add_column kwargs)
+_PRICING_COLUMNS: tuple[tuple[str, dict[str, str]], ...] = (
+    ("Type", {"style": "dim"}),
+    ("Cost / 1M tokens", {"justify": "right"}),
+)
+_CONTEXT_COLUMNS: tuple[tuple[str, dict[str, str]], ...] = (
+    ("Limit", {"style": "dim"}),
+    ("Tokens", {"justify": "right"}),
+)
+_SEARCH_COLUMNS: tuple[tuple[str, dict[str, str]], ...] = (
+    ("Model", {"style": "cyan"}),
+    ("Provider", {"style": "dim"}),
+    ("Input / 1M", {"justify": "right"}),
+    ("Output / 1M", {"justify": "right"}),
+)
+_COMPARE_COLUMNS = _SEARCH_COLUMNS + (("Max input", {"justify": "right"}),)
+
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _get_err_console() -> "Console":
+    """Return the shared stderr console, so errors don't mix into piped output."""
+    global _err_console
+    if _err_console is None:
+        from rich.console import Console
+
+        _err_console = Console(stderr=True)
+    return _err_console
+
+
+def _new_table(
+    columns: tuple[tuple[str, dict[str, str]], ...], **options: Any
+) -> "Table":
+    """Build a Rich table with a bold header row and the given columns."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold", **options)
+    for header, column_options in columns:
+        table.add_column(header, **column_options)
+    return table
+
+
+@lru_cache(maxsize=512)
 def format_cost(cost_per_token: float | None) -> str:
     """Format cost per token as cost per million tokens.
 
@@ -25,14 +94,12 @@ def format_cost(cost_per_token: float | None) -> str:
     if cost_per_token == 0:
         return "Free"
     cost_per_million = cost_per_token * 1_000_000
+    if cost_per_million >= 1:
+        return f"${cost_per_million:.2f}"
     if cost_per_million < 0.01:
         return f"${cost_per_million:.4f}"
-    elif cost_per_million < 1:
-        # Format and strip trailing zeros
-        formatted = f"{cost_per_million:.2f}"
-        return f"${formatted.rstrip('0').rstrip('.')}"
-    else:
-        return f"${cost_per_million:.2f}"
+    # Sub-dollar costs drop trailing zeros ('$0.5', not '$0.50')
+    return "$" + f"{cost_per_million:.2f}".rstrip("0").rstrip(".")
 
 
 def format_tokens(tokens: int | None) -> str:
@@ -47,18 +114,19 @@ def format_tokens(tokens: int | None) -> str:
     if tokens is None:
         return "-"
     if tokens >= 1_000_000:
-        value = tokens / 1_000_000
-        if value == int(value):
-            return f"{int(value)}M"
-        return f"{value:.1f}M".rstrip("0").rstrip(".")
-    elif tokens >= 1_000:
-        value = tokens / 1_000
-        if value == int(value):
-            return f"{int(value)}K"
-        return f"{value:.1f}K".rstrip("0").rstrip(".")
+        millions, remainder = divmod(tokens, 1_000_000)
+        if not remainder:
+            return f"{millions}M"
+        return f"{tokens / 1_000_000:.1f}M"
+    if tokens >= 1_000:
+        thousands, remainder = divmod(tokens, 1_000)
+        if not remainder:
+            return f"{thousands}K"
+        return f"{tokens / 1_000:.1f}K"
     return str(tokens)
 
 
+@lru_cache(maxsize=512)
 def get_cost_style(cost_per_token: float | None) -> str:
     """Get Rich style based on cost tier.
 
@@ -79,6 +147,18 @@ def get_cost_style(cost_per_token: float | None) -> str:
         return "red"
 
 
+def _cost_markup(cost_per_token: float | None) -> str:
+    """Build a colour-coded cost cell as Rich markup.
+
+    Args:
+        cost_per_token: Cost in dollars per token, or None.
+
+    Returns:
+        format_cost() wrapped in get_cost_style() markup, e.g. '[red]$60.00[/]'.
+    """
+    return f"[{get_cost_style(cost_per_token)}]{format_cost(cost_per_token)}[/]"
+
+
 def display_model(data: dict[str, Any], json_output: bool = False) -> None:
     """Display detailed model information.
 
@@ -87,9 +167,14 @@ def display_model(data: dict[str, Any], json_output: bool = False) -> None:
         json_output: If True, output raw JSON instead of formatted table.
     """
     if json_output:
-        console.print(json.dumps(data, indent=2))
+        print(_json.dumps(data, indent=True))
         return
 
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = _get_console()
+
     # Model header
     name = data.get("litellm_model_name", data.get("slug", "Unknown"))
     provider = data.get("litellm_provider", "Unknown")
@@ -99,35 +184,19 @@ def display_model(data: dict[str, Any], json_output: bool = False) -> None:
     title.append(f" ({provider})", style="dim")
 
     # Pricing table
-    pricing_table = Table(show_header=True, header_style="bold", box=None)
-    pricing_table.add_column("Type", style="dim")
-    pricing_table.add_column("Cost / 1M tokens", justify="right")
+    pricing_table = _new_table(_PRICING_COLUMNS, box=None)
 
-    input_cost = data.get("input_cost_per_token")
-    output_cost = data.get("output_cost_per_token")
-
-    pricing_table.add_row(
-        "Input", Text(format_cost(input_cost), style=get_cost_style(input_cost))
-    )
-    pricing_table.add_row(
-        "Output", Text(format_cost(output_cost), style=get_cost_style(output_cost))
-    )
+    pricing_table.add_row("Input", _cost_markup(data.get("input_cost_per_token")))
+    pricing_table.add_row("Output", _cost_markup(data.get("output_cost_per_token")))
 
     # Add cache costs if present
     if cache_read := data.get("cache_read_input_token_cost"):
-        pricing_table.add_row(
-            "Cache read", Text(format_cost(cache_read), style=get_cost_style(cache_read))
-        )
+        pricing_table.add_row("Cache read", _cost_markup(cache_read))
     if cache_write := data.get("cache_creation_input_token_cost"):
-        pricing_table.add_row(
-            "Cache write",
-            Text(format_cost(cache_write), style=get_cost_style(cache_write)),
-        )
+        pricing_table.add_row("Cache write", _cost_markup(cache_write))
 
     # Context window
-    context_table = Table(show_header=True, header_style="bold", box=None)
-    context_table.add_column("Limit", style="dim")
-    context_table.add_column("Tokens", justify="right")
+    context_table = _new_table(_CONTEXT_COLUMNS, box=None)
 
     if max_input := data.get("max_input_tokens"):
         context_table.add_row("Max input", format_tokens(max_input))
@@ -137,22 +206,8 @@ def display_model(data: dict[str, Any], json_output: bool = False) -> None:
         context_table.add_row("Max total", format_tokens(max_tokens))
 
     # Capabilities
-    capabilities = []
-    capability_fields = [
-        ("supports_vision", "Vision"),
-        ("supports_function_calling", "Functions"),
-        ("supports_tool_choice", "Tool choice"),
-        ("supports_prompt_caching", "Caching"),
-        ("supports_response_schema", "Schema"),
-        ("supports_system_messages", "System msgs"),
-        ("supports_audio_input", "Audio in"),
-        ("supports_audio_output", "Audio out"),
-        ("supports_pdf_input", "PDF"),
-    ]
-
-    for field, label in capability_fields:
-        if data.get(field):
-            capabilities.append(label)
+    present = _CAP_SET & data.keys()
+    capabilities = [_CAP_LABELS[f] for f in _CAP_KEYS if f in present and data[f]]
 
     # Build output
     console.print()
@@ -183,9 +238,11 @@ def display_search_results(data: dict[str, Any], json_output: bool = False) -> N
         json_output: If True, output raw JSON instead of formatted table.
     """
     if json_output:
-        console.print(json.dumps(data, indent=2))
+        print(_json.dumps(data, indent=True))
         return
 
+    console = _get_console()
+
     results = data.get("results", [])
     count = data.get("count", len(results))
     query = data.get("query", "")
@@ -198,23 +255,51 @@ def display_search_results(data: dict[str, Any], json_output: bool = False) -> N
     console.print(f"[dim]Found {count} model(s) for '{query}'[/dim]")
     console.print()
 
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("Model", style="cyan")
-    table.add_column("Provider", style="dim")
-    table.add_column("Input / 1M", justify="right")
-    table.add_column("Output / 1M", justify="right")
+    table = _new_table(_SEARCH_COLUMNS)
+
+    rows = [
+        (
+            model.get("slug") or model.get("name") or "?",
+            model.get("provider", "-"),
+            model.get("input_cost_per_token"),
+            model.get("output_cost_per_token"),
+        )
+        for model in results
+    ]
+    for name, provider, input_cost, output_cost in rows:
+        table.add_row(
+            name, provider, _cost_markup(input_cost), _cost_markup(output_cost)
+        )
+
+    console.print(table)
+    console.print()
+
 
-    for model in results:
-        input_cost = model.get("input_cost_per_token")
-        output_cost = model.get("output_cost_per_token")
+def display_comparison(models: list[dict[str, Any]], json_output: bool = False) -> None:
+    """Display several models side by side.
 
+    Args:
+        models: Model data from the API, in the order requested.
+        json_output: If True, output raw JSON instead of formatted table.
+    """
+    if json_output:
+        print(_json.dumps(models, indent=True))
+        return
+
+    console = _get_console()
+
+    table = _new_table(_COMPARE_COLUMNS)
+
+    for model in models:
         table.add_row(
-            model.get("slug", model.get("name", "?")),
-            model.get("provider", "-"),
-            Text(format_cost(input_cost), style=get_cost_style(input_cost)),
-            Text(format_cost(output_cost), style=get_cost_style(output_cost)),
+            model.get("litellm_model_name", model.get("slug", "Unknown")),
+            model.get("litellm_provider", "-"),
+            _cost_markup(model.get("input_cost_per_token")),
+            _cost_markup(model.get("output_cost_per_token")),
+            format_tokens(model.get("max_input_tokens")),
         )
 
+    console.print()
     console.print(table)
     console.print()
 
@@ -227,9 +312,10 @@ def display_providers(providers: list[str], json_output: bool = False) -> None:
         json_output: If True, output raw JSON instead of formatted list.
     """
     if json_output:
-        console.print(json.dumps(providers, indent=2))
+        print(_json.dumps(providers, indent=True))
         return
 
+    console = _get_console()
     console.print()
     console.print(f"[bold]Providers[/bold] ({len(providers)})")
     console.print()
@@ -248,4 +334,4 @@ def display_error(message: str) -> None:
     Args:
         message: The error message to display.
     """
-    console.print(f"[red]Error:[/red] {message}")
+    _get_err_console().print(f"[red]Error:[/red] {message}")
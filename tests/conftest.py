@@ -4,3 +4,10 @@ import pytest
 
 
 # pytest-httpx provides the httpx_mock fixture automatically
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the response cache at a per-test directory."""
+    monkeypatch.setattr("toktab.cache.CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
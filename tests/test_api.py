@@ -1,9 +1,15 @@
 """Tests for the TokTab API client."""
 
+import asyncio
+
 import pytest
 import httpx
 
+from toktab import api, cache
 from toktab.api import (
+    aget_model,
+    asearch,
+    close_async,
     get_model,
     search,
     ModelNotFoundError,
@@ -56,6 +62,87 @@ class TestGetModel:
         with pytest.raises(APIError, match="Network error"):
             get_model("gpt-4o")
 
+    def test_get_model_slug_with_colon(self, httpx_mock):
+        """Test slugs containing ':' stay under the API path."""
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/openai:gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+
+        result = get_model("openai:gpt-4o")
+
+        assert result["litellm_model_name"] == "gpt-4o"
+
+    def test_get_model_uses_cache(self, httpx_mock):
+        """Test a second lookup is served from the cache."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        first = get_model("gpt-4o")
+        second = get_model("gpt-4o")
+
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_get_model_bypass_cache(self, httpx_mock):
+        """Test use_cache=False always hits the API."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        get_model("gpt-4o", use_cache=False)
+        get_model("gpt-4o", use_cache=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_get_model_revalidates_with_etag(self, httpx_mock):
+        """Test an expired entry is revalidated and reused on 304."""
+        httpx_mock.add_response(
+            json={"litellm_model_name": "gpt-4o"},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(status_code=304)
+
+        get_model("gpt-4o")
+        key = cache.make_key("model:gpt-4o")
+        cache.touch(key, ttl=-1)
+        result = get_model("gpt-4o")
+
+        assert result["litellm_model_name"] == "gpt-4o"
+        second = httpx_mock.get_requests()[1]
+        assert second.headers["If-None-Match"] == '"v1"'
+        assert cache.get(key) == result
+
+    def test_get_model_keeps_etag_from_304(self, httpx_mock):
+        """Test a new ETag sent with a 304 is used for the next revalidation."""
+        httpx_mock.add_response(
+            json={"litellm_model_name": "gpt-4o"},
+            headers={"ETag": '"v1"'},
+        )
+        httpx_mock.add_response(status_code=304, headers={"ETag": '"v2"'})
+
+        get_model("gpt-4o")
+        key = cache.make_key("model:gpt-4o")
+        cache.touch(key, ttl=-1)
+        result = get_model("gpt-4o")
+
+        assert cache.get_stale(key) == (result, '"v2"')
+
+    def test_get_model_replaces_changed_entry(self, httpx_mock):
+        """Test a 200 on revalidation replaces the cached body."""
+        httpx_mock.add_response(
+            json={"input_cost_per_token": 1}, headers={"ETag": '"v1"'}
+        )
+        httpx_mock.add_response(
+            json={"input_cost_per_token": 2}, headers={"ETag": '"v2"'}
+        )
+
+        get_model("gpt-4o")
+        key = cache.make_key("model:gpt-4o")
+        cache.touch(key, ttl=-1)
+        result = get_model("gpt-4o")
+
+        assert result["input_cost_per_token"] == 2
+        assert cache.get_stale(key) == (result, '"v2"')
+
 
 class TestSearch:
     def test_search_success(self, httpx_mock):
@@ -104,3 +191,157 @@ class TestSearch:
 
         with pytest.raises(APIError, match="Invalid search query"):
             search("")
+
+    def test_search_uses_cache(self, httpx_mock):
+        """Test repeated searches are served from the cache."""
+        httpx_mock.add_response(json={"results": [], "query": "test", "count": 0})
+
+        search("test")
+        search("test")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_search_cache_keyed_on_exact_query(self, httpx_mock):
+        """Test differently worded queries are fetched separately."""
+        httpx_mock.add_response(json={"results": [], "query": "gpt-4", "count": 0})
+        httpx_mock.add_response(
+            json={"results": [], "query": "provider: gpt-4", "count": 0}
+        )
+
+        search("gpt-4")
+        result = search("provider: gpt-4")
+
+        assert result["query"] == "provider: gpt-4"
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestClient:
+    def test_client_is_reused(self, httpx_mock):
+        """Test requests share a single pooled client."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        httpx_mock.add_response(json={"results": [], "query": "gpt", "count": 0})
+
+        get_model("gpt-4o")
+        client = api._client
+        search("gpt")
+
+        assert client is not None
+        assert api._client is client
+
+    def test_brotli_responses_are_decoded(self, httpx_mock):
+        """Test br-encoded responses decode when brotli is installed."""
+        brotli = pytest.importorskip("brotli")
+        body = brotli.compress(b'{"litellm_model_name": "gpt-4o"}')
+        httpx_mock.add_response(
+            stream=httpx.ByteStream(body),
+            headers={"Content-Encoding": "br"},
+        )
+
+        result = get_model("gpt-4o")
+
+        assert result["litellm_model_name"] == "gpt-4o"
+        assert "br" in httpx_mock.get_request().headers["Accept-Encoding"]
+
+
+async def _run_closing(coro):
+    """Await a coroutine, then close the async client in the same loop."""
+    try:
+        return await coro
+    finally:
+        await close_async()
+
+
+class TestAsync:
+    def test_aget_model_success(self, httpx_mock):
+        """Test successful async model fetch."""
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+
+        result = asyncio.run(_run_closing(aget_model("gpt-4o")))
+
+        assert result["litellm_model_name"] == "gpt-4o"
+
+    def test_aget_model_not_found(self, httpx_mock):
+        """Test async 404 response raises ModelNotFoundError."""
+        httpx_mock.add_response(status_code=404)
+
+        with pytest.raises(ModelNotFoundError, match="not found"):
+            asyncio.run(_run_closing(aget_model("nonexistent-model")))
+
+    def test_aget_model_timeout(self, httpx_mock):
+        """Test async timeout raises APIError."""
+        httpx_mock.add_exception(httpx.TimeoutException("timeout"))
+
+        with pytest.raises(APIError, match="timed out"):
+            asyncio.run(_run_closing(aget_model("gpt-4o")))
+
+    def test_aget_model_uses_cache(self, httpx_mock):
+        """Test async lookups share the on-disk cache with get_model."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        get_model("gpt-4o")
+        result = asyncio.run(_run_closing(aget_model("gpt-4o")))
+
+        assert result["litellm_model_name"] == "gpt-4o"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_aget_model_bypass_cache(self, httpx_mock):
+        """Test use_cache=False always hits the API."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        get_model("gpt-4o")
+        asyncio.run(_run_closing(aget_model("gpt-4o", use_cache=False)))
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_aget_model_deduplicates_concurrent_calls(self, httpx_mock):
+        """Test concurrent lookups of one slug share a request."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        async def lookup_twice():
+            return await asyncio.gather(aget_model("gpt-4o"), aget_model("gpt-4o"))
+
+        first, second = asyncio.run(_run_closing(lookup_twice()))
+
+        assert first is second
+        assert len(httpx_mock.get_requests()) == 1
+        assert not api._inflight
+
+    def test_cancelling_one_caller_keeps_shared_lookup(self, httpx_mock):
+        """Test other callers still get a result if one is cancelled."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        async def cancel_first():
+            first = asyncio.create_task(aget_model("gpt-4o"))
+            second = asyncio.create_task(aget_model("gpt-4o"))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        result = asyncio.run(_run_closing(cancel_first()))
+
+        assert result["litellm_model_name"] == "gpt-4o"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_asearch_success(self, httpx_mock):
+        """Test successful async search."""
+        httpx_mock.add_response(json={"results": [], "query": "test", "count": 0})
+
+        result = asyncio.run(_run_closing(asearch("test", limit=100)))
+
+        assert result["count"] == 0
+        assert "limit=50" in str(httpx_mock.get_request().url)
+
+    def test_asearch_uses_cache(self, httpx_mock):
+        """Test async searches are served from the cache."""
+        httpx_mock.add_response(json={"results": [], "query": "test", "count": 0})
+
+        search("test")
+        asyncio.run(_run_closing(asearch("test")))
+
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,85 @@
+"""Tests for the on-disk response cache."""
+
+import sqlite3
+
+from toktab import cache
+
+
+class TestCache:
+    def test_miss_returns_none(self):
+        assert cache.get(cache.make_key("missing")) is None
+
+    def test_set_then_get(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"litellm_model_name": "gpt-4o"})
+        assert cache.get(key) == {"litellm_model_name": "gpt-4o"}
+
+    def test_expired_entry_is_a_miss(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"litellm_model_name": "gpt-4o"}, ttl=-1)
+        assert cache.get(key) is None
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"litellm_model_name": "gpt-4o"})
+        with cache._lock:
+            cache._connect().execute(
+                "UPDATE entries SET body = ? WHERE key = ?", (b"not json", key)
+            )
+        assert cache.get(key) is None
+
+    def test_uses_wal_journal(self, isolated_cache):
+        cache.set(cache.make_key("a"), 1)
+        with cache._lock:
+            mode = cache._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        assert (isolated_cache / "cache.sqlite3").exists()
+
+    def test_get_stale_returns_expired_entry_with_etag(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"a": 1}, ttl=-1, etag='"v1"')
+        assert cache.get(key) is None
+        assert cache.get_stale(key) == ({"a": 1}, '"v1"')
+
+    def test_get_stale_ignores_entries_without_etag(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"a": 1}, ttl=-1)
+        assert cache.get_stale(key) is None
+
+    def test_touch_extends_expiry(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"a": 1}, ttl=-1)
+        cache.touch(key)
+        assert cache.get(key) == {"a": 1}
+
+    def test_touch_updates_etag_when_given(self):
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"a": 1}, ttl=-1, etag='"v1"')
+        cache.touch(key)
+        assert cache.get_stale(key) == ({"a": 1}, '"v1"')
+        cache.touch(key, etag='"v2"')
+        assert cache.get_stale(key) == ({"a": 1}, '"v2"')
+
+    def test_adds_etag_column_to_existing_database(self, isolated_cache):
+        isolated_cache.mkdir()
+        conn = sqlite3.connect(isolated_cache / "cache.sqlite3")
+        conn.execute(
+            "CREATE TABLE entries (key TEXT PRIMARY KEY, expires INTEGER NOT NULL, "
+            "body BLOB NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        key = cache.make_key("model:gpt-4o")
+        cache.set(key, {"a": 1}, ttl=-1, etag='"v1"')
+        assert cache.get_stale(key) == ({"a": 1}, '"v1"')
+
+    def test_clear(self):
+        cache.set(cache.make_key("a"), 1)
+        cache.set(cache.make_key("b"), 2)
+        assert cache.clear() == 2
+        assert cache.get(cache.make_key("a")) is None
+
+    def test_keys_are_stable(self):
+        assert cache.make_key("model:gpt-4o") == cache.make_key("model:gpt-4o")
+        assert cache.make_key("model:gpt-4o") != cache.make_key("model:gpt-4")
@@ -1,7 +1,10 @@
 """Tests for the CLI commands."""
 
 import json
+import subprocess
+import sys
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -13,6 +16,17 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture
+def split_runner():
+    """A runner that captures stderr separately from stdout."""
+    try:
+        # Click < 8.2 mixes stderr into stdout unless told otherwise
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        # Click >= 8.2 always captures stderr separately
+        return CliRunner()
+
+
 class TestCLI:
     def test_help(self, runner):
         """Test --help shows usage."""
@@ -27,6 +41,22 @@ class TestCLI:
         assert result.exit_code == 0
         assert "toktab" in result.output
 
+    def test_version_skips_heavy_imports(self):
+        """Test --version doesn't load httpx or Rich."""
+        code = (
+            "import sys\n"
+            "from toktab.cli import cli\n"
+            "try:\n"
+            "    cli(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('httpx', 'rich') if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip().endswith("[]")
+
     def test_no_args_shows_help(self, runner):
         """Test running without args shows help."""
         result = runner.invoke(cli, [])
@@ -74,6 +104,32 @@ class TestModelCommand:
         assert result.exit_code == 1
         assert "not found" in result.output
 
+    def test_model_no_cache(self, runner, httpx_mock):
+        """Test --no-cache fetches fresh data every time."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        runner.invoke(cli, ["--no-cache", "gpt-4o"])
+        result = runner.invoke(cli, ["--no-cache", "gpt-4o"])
+
+        assert result.exit_code == 0
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_model_command_is_reused(self):
+        """Test repeated lookups of a name reuse the same command."""
+        ctx = click.Context(cli)
+        assert cli.get_command(ctx, "gpt-4o") is cli.get_command(ctx, "gpt-4o")
+
+    def test_reused_command_reads_current_options(self, runner, httpx_mock):
+        """Test a cached command honours options from each invocation."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        runner.invoke(cli, ["gpt-4o"])
+        result = runner.invoke(cli, ["--json", "gpt-4o"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["litellm_model_name"] == "gpt-4o"
+
 
 class TestSearchCommand:
     def test_search(self, runner, httpx_mock):
@@ -113,3 +169,163 @@ class TestSearchCommand:
         assert result.exit_code == 0
         parsed = json.loads(result.output)
         assert "results" in parsed
+
+
+class TestCompareCommand:
+    def test_compare(self, runner, httpx_mock):
+        """Test comparing several models."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o", "litellm_provider": "openai"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/claude-3-opus/",
+            json={"litellm_model_name": "claude-3-opus", "litellm_provider": "anthropic"},
+        )
+
+        result = runner.invoke(cli, ["compare", "gpt-4o", "claude-3-opus"])
+
+        assert result.exit_code == 0
+        assert "gpt-4o" in result.output
+        assert "claude-3-opus" in result.output
+
+    def test_compare_json_output(self, runner, httpx_mock):
+        """Test compare --json keeps the requested order."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/claude-3-opus/",
+            json={"litellm_model_name": "claude-3-opus"},
+        )
+
+        result = runner.invoke(cli, ["compare", "--json", "gpt-4o", "claude-3-opus"])
+
+        assert result.exit_code == 0
+        parsed = json.loads(result.output)
+        assert [m["litellm_model_name"] for m in parsed] == ["gpt-4o", "claude-3-opus"]
+
+    def test_compare_uses_cache(self, runner, httpx_mock):
+        """Test compare reuses responses cached by a model lookup."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        runner.invoke(cli, ["gpt-4o"])
+        result = runner.invoke(cli, ["compare", "gpt-4o"])
+
+        assert result.exit_code == 0
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["compare", "--no-cache", "gpt-4o"],
+            ["--no-cache", "compare", "gpt-4o"],
+        ],
+    )
+    def test_compare_no_cache(self, runner, httpx_mock, args):
+        """Test --no-cache works on compare and before it."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+
+        runner.invoke(cli, ["gpt-4o"])
+        result = runner.invoke(cli, args)
+
+        assert result.exit_code == 0
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_compare_not_found(self, runner, httpx_mock):
+        """Test compare fails if any model is unknown."""
+        httpx_mock.add_response(status_code=404)
+
+        result = runner.invoke(cli, ["compare", "nonexistent"])
+
+        assert result.exit_code == 1
+        assert "not found" in result.output
+
+
+class TestBatchCommand:
+    def test_batch_from_stdin(self, runner, httpx_mock):
+        """Test batch looks up each slug from stdin."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/claude-3-opus/",
+            json={"litellm_model_name": "claude-3-opus"},
+        )
+
+        result = runner.invoke(cli, ["batch", "-"], input="gpt-4o\n\nclaude-3-opus\n")
+
+        assert result.exit_code == 0
+        assert "gpt-4o" in result.output
+        assert "claude-3-opus" in result.output
+
+    def test_batch_json_keeps_input_order(self, runner, httpx_mock):
+        """Test batch --json outputs models in input order."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/claude-3-opus/",
+            json={"litellm_model_name": "claude-3-opus"},
+        )
+
+        result = runner.invoke(
+            cli, ["batch", "--json", "-"], input="gpt-4o\nclaude-3-opus\n"
+        )
+
+        assert result.exit_code == 0
+        parsed = json.loads(result.output)
+        assert [m["litellm_model_name"] for m in parsed] == ["gpt-4o", "claude-3-opus"]
+
+    def test_batch_reports_missing_models(self, runner, httpx_mock):
+        """Test batch continues past unknown models and exits non-zero."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/nonexistent/",
+            status_code=404,
+        )
+
+        result = runner.invoke(cli, ["batch", "-"], input="nonexistent\ngpt-4o\n")
+
+        assert result.exit_code == 1
+        assert "not found" in result.output
+        assert "gpt-4o" in result.output
+
+    def test_batch_json_errors_go_to_stderr(self, split_runner, httpx_mock):
+        """Test failed lookups don't corrupt --json output on stdout."""
+        httpx_mock.add_response(
+            url="https://toktab.com/api/gpt-4o/",
+            json={"litellm_model_name": "gpt-4o"},
+        )
+        httpx_mock.add_response(
+            url="https://toktab.com/api/nope/",
+            status_code=404,
+        )
+
+        result = split_runner.invoke(
+            cli, ["batch", "--json", "-"], input="nope\ngpt-4o\n"
+        )
+
+        assert result.exit_code == 1
+        parsed = json.loads(result.stdout)
+        assert [m["litellm_model_name"] for m in parsed] == ["gpt-4o"]
+        assert "not found" in result.stderr
+
+
+class TestCacheCommand:
+    def test_cache_clear(self, runner, httpx_mock):
+        """Test cache clear removes stored responses."""
+        httpx_mock.add_response(json={"litellm_model_name": "gpt-4o"})
+        runner.invoke(cli, ["gpt-4o"])
+
+        result = runner.invoke(cli, ["cache", "clear"])
+
+        assert result.exit_code == 0
+        assert "Removed 1" in result.output
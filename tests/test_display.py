@@ -2,7 +2,13 @@
 
 import pytest
 
-from toktab.display import format_cost, format_tokens, get_cost_style
+from toktab.display import (
+    _cost_markup,
+    display_model,
+    format_cost,
+    format_tokens,
+    get_cost_style,
+)
 
 
 class TestFormatCost:
@@ -27,6 +33,10 @@ class TestFormatCost:
         result = format_cost(0.00006)
         assert result == "$60.00"
 
+    def test_sub_cent_cost(self):
+        # $0.000000001 per token = $0.001 per million
+        assert format_cost(0.000000001) == "$0.0010"
+
     def test_tiny_cost(self):
         # $0.00000001 per token = $0.01 per million
         result = format_cost(0.00000001)
@@ -51,6 +61,10 @@ class TestFormatTokens:
     def test_removes_trailing_zeros(self):
         assert format_tokens(8192) == "8.2K"
 
+    def test_fractional_millions(self):
+        assert format_tokens(1048576) == "1.0M"
+        assert format_tokens(1500000) == "1.5M"
+
 
 class TestGetCostStyle:
     def test_none_is_green(self):
@@ -70,3 +84,29 @@ class TestGetCostStyle:
     def test_high_cost_is_red(self):
         # More than $10 per million
         assert get_cost_style(0.00002) == "red"
+
+
+class TestCostMarkup:
+    @pytest.mark.parametrize(
+        "cost", [None, 0, 0.000000001, 0.0000005, 0.000005, 0.00002, 0.00006]
+    )
+    def test_matches_format_and_style(self, cost):
+        expected = f"[{get_cost_style(cost)}]{format_cost(cost)}[/]"
+        assert _cost_markup(cost) == expected
+
+
+class TestDisplayModel:
+    def test_capabilities_in_fixed_order(self, capsys):
+        display_model(
+            {
+                "litellm_model_name": "gpt-4o",
+                "supports_pdf_input": True,
+                "supports_vision": True,
+                "supports_tool_choice": False,
+                "unrelated_flag": True,
+            }
+        )
+        output = capsys.readouterr().out
+        assert "Vision" in output
+        assert output.index("Vision") < output.index("PDF")
+        assert "Tool choice" not in output